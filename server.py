@@ -1,25 +1,103 @@
 from mcp.server.fastmcp import FastMCP
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from typing import Optional, Dict, Any
-from utils.n8n_monitor_sync import N8nMonitor
+from utils.n8n_monitor_sync import ERROR_FIELDS, MAX_CONCURRENT_CALLS, N8nMonitor
+from utils.ttl_cache import TTLCache
+
+
+class PeriodicallyFlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes its buffer every `period` seconds"""
+
+    def __init__(self, capacity, flushLevel=logging.ERROR, target=None,
+                 flushOnClose=True, period=0.5):
+        super().__init__(capacity, flushLevel=flushLevel, target=target,
+                         flushOnClose=flushOnClose)
+        self._period = period
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self._period):
+            self.flush()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+# Tools only enqueue log records; a background listener does the file/stderr I/O
+file_h = logging.FileHandler("n8n_monitor.log")
+# Batch file writes; ERROR records and full buffers are written immediately
+mem_h = PeriodicallyFlushingMemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_h, flushOnClose=True)
+stream_h = logging.StreamHandler()
+log_queue = queue.Queue(-1)
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("n8n_monitor.log"),
-        logging.StreamHandler()
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 
+listener = logging.handlers.QueueListener(log_queue, mem_h, stream_h, respect_handler_level=True)
+listener.start()
+
+
+def _stop_logging():
+    """Drain queued log records and write buffered ones to disk"""
+    listener.stop()
+    mem_h.close()
+    for handler in (file_h, stream_h):
+        handler.flush()
+
+
+# Runs before logging's own atexit shutdown, so no record is lost when the server dies
+atexit.register(_stop_logging)
+
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("n8n-monitor")
 
 monitor = N8nMonitor()
 
+# Largest execution window the tools will request from n8n
+_MAX_LIMIT = 100
+
+# Successful tool results are reused for a short window to avoid repeated n8n round trips.
+# N8nMonitor keeps its own 5 s cache of webhook responses (and a 60 s workflow-name map) below
+# this one, so a tool result can be at most: 20 s old for workflows and executions, 35 s for
+# error executions, and 65 s for health reports (whose workflow names are built from a 5 s cached
+# response and kept 60 s, so they may be up to 125 s old).
+_CACHE_TTL = 15.0
+# Error executions and health reports change slowly, debugging sessions re-ask for them minutes apart
+_CACHE_TTLS = {"err": 30.0, "health": 60.0}
+_cache = TTLCache(ttl=_CACHE_TTL, maxsize=128)
+
+# Monitor calls are blocking HTTP requests: run them in worker threads, a bounded number at a time
+_n8n_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+
+async def _memo(key: tuple, fn, *args, **kwargs) -> Dict[str, Any]:
+    """Return the cached result for key, running fn(*args, **kwargs) in a thread on a miss or after expiry"""
+    hit = _cache.get(key)
+    if hit is not None:
+        return hit
+    
+    async with _n8n_semaphore:
+        result = await asyncio.to_thread(fn, *args, **kwargs)
+    
+    _cache.put(key, result, ttl=_CACHE_TTLS.get(key[0]))
+    return result
+
 @mcp.tool()
-def get_active_workflows() -> Dict[str, Any]:
+async def get_active_workflows() -> Dict[str, Any]:
     """
     Get all active workflows in the n8n instance.
     
@@ -28,22 +106,22 @@ def get_active_workflows() -> Dict[str, Any]:
     """
     try:
         logger.info("Fetching active workflows")
-        result = monitor.get_active_workflows()
+        result = await _memo(("active",), monitor.get_active_workflows)
         
         if "error" in result:
-            logger.error(f"Failed to get workflows: {result['error']}")
-        else:
-            logger.info(f"Found {result.get('total_active', 0)} active workflows")
+            logger.error("Failed to get workflows: %s", result['error'])
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("Found %s active workflows", result.get('total_active', 0))
         
         return result
         
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def get_workflow_executions(
+async def get_workflow_executions(
     limit: int = 50,
     include_kpis: bool = True
 ) -> Dict[str, Any]:
@@ -51,67 +129,82 @@ def get_workflow_executions(
     Get workflow execution logs and KPIs for the last N executions.
     
     Args:
-        limit: Number of executions to retrieve (default: 50)
+        limit: Number of executions to retrieve, 1-100 (default: 50)
         include_kpis: Include calculated KPIs (default: true)
     
     Returns:
         Dictionary with execution data and KPIs
     """
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return {"error": "limit must be a positive integer"}
+    limit = min(limit, _MAX_LIMIT)
+    
     try:
-        logger.info(f"Fetching the last {limit} executions")
+        logger.info("Fetching the last %s executions", limit)
         
-        result = monitor.get_workflow_executions(
+        result = await _memo(
+            ("exec", limit, include_kpis),
+            monitor.get_workflow_executions,
             limit=limit,
             includes_kpis=include_kpis
         )
         
         if "error" in result:
-            logger.error(f"Failed to get executions: {result['error']}")
-        else:
+            logger.error("Failed to get executions: %s", result['error'])
+        elif logger.isEnabledFor(logging.INFO):
             if "summary" in result:
                 summary = result["summary"]
-                logger.info(f"Executions: {summary.get('totalExecutions', 0)}, "
-                          f"Failure rate: {summary.get('failureRate', 'N/A')}")
+                logger.info("Executions: %s, Failure rate: %s",
+                            summary.get('totalExecutions', 0),
+                            summary.get('failureRate', 'N/A'))
         
         return result
         
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return {"error": str(e)}
 
 
 @mcp.tool()
-def get_workflow_health_report(limit: int = 50) -> Dict[str, Any]:
+async def get_workflow_health_report(limit: int = 50) -> Dict[str, Any]:
     """
     Generate a comprehensive health report for all workflows.
     
     Args:
-        limit: Number of recent executions to analyze (default: 50)
+        limit: Number of recent executions to analyze, 1-100 (default: 50)
     
     Returns:
         Dictionary with health report including problematic workflows and metrics
     """
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        return {"error": "limit must be a positive integer"}
+    limit = min(limit, _MAX_LIMIT)
+    
     try:
-        logger.info(f"Generating health report for last {limit} executions")
+        logger.info("Generating health report for last %s executions", limit)
         
-        result = monitor.get_workflow_health_report(limit=limit)
+        result = await _memo(
+            ("health", limit),
+            monitor.get_workflow_health_report,
+            limit=limit
+        )
         
         if "error" in result:
-            logger.error(f"Failed to generate report: {result['error']}")
-        else:
+            logger.error("Failed to generate report: %s", result['error'])
+        elif logger.isEnabledFor(logging.INFO):
             if "overall_health" in result:
                 health = result["overall_health"]
-                logger.info(f"Health status: {health.get('health_status', 'N/A')}")
+                logger.info("Health status: %s", health.get('health_status', 'N/A'))
         
         return result
         
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return {"error": str(e)}
     
     
 @mcp.tool()
-def get_error_executions(workflow_id: str) -> Dict[str, Any]:
+async def get_error_executions(workflow_id: str, summary_only: bool = False) -> Dict[str, Any]:
     """
     Retrieve detailed error execution data for debugging workflow failures in n8n.
     
@@ -123,6 +216,8 @@ def get_error_executions(workflow_id: str) -> Dict[str, Any]:
     Args:
         workflow_id: The unique identifier of the n8n workflow to analyze.
                     Example: "CGvCrnUyGHgB7fi8"
+        summary_only: Leave out the error, failed_node, trigger and duration_seconds
+                    details of each execution and keep the summary (default: false)
     
     Returns:
         Dict containing:
@@ -181,35 +276,37 @@ def get_error_executions(workflow_id: str) -> Dict[str, Any]:
         parameters that triggered failures, making it easy to reproduce and fix issues.
     """
     try:
-        logger.info(f"Fetching error executions for workflow {workflow_id}")
+        logger.info("Fetching error executions for workflow %s", workflow_id)
         
-        result = monitor.get_error_executions(workflow_id=workflow_id)
+        result = await _memo(
+            ("err", workflow_id, summary_only),
+            monitor.get_error_executions,
+            workflow_id=workflow_id,
+            fields=frozenset() if summary_only else ERROR_FIELDS
+        )
         
         if "error" in result:
-            logger.error(f"Failed to get error executions: {result['error']}")
-        else:
+            logger.error("Failed to get error executions: %s", result['error'])
+        elif logger.isEnabledFor(logging.INFO):
             error_count = result.get('error_count', 0)
-            logger.info(f"Found {error_count} error executions for workflow {workflow_id}")
+            logger.info("Found %s error executions for workflow %s", error_count, workflow_id)
             
             # Log summary information for debugging
             if error_count > 0 and "summary" in result:
                 patterns = result["summary"].get("error_patterns", {})
                 if patterns:
-                    most_common = max(patterns.items(), key=lambda x: x[1]["count"])
-                    logger.info(f"Most common error: '{most_common[0]}' ({most_common[1]['count']} occurrences)")
+                    most_common = max(patterns.items(), key=lambda kv: kv[1].get("count", 0))
+                    logger.info("Most common error: '%s' (%s occurrences)", most_common[0], most_common[1].get('count', 0))
         
         return result
         
     except Exception as e:
-        logger.error(f"Unexpected error in get_error_executions: {str(e)}")
+        logger.error("Unexpected error in get_error_executions: %s", e)
         return {"error": str(e)}
 
 
-# Resource for the agent (Samir: update it each time you add a tool)
-@mcp.resource("n8n://help")
-def get_help() -> str:
-    """Get help documentation for the n8n monitoring tools"""
-    return """
+# Help text for the agent (Samir: update it each time you add a tool)
+_HELP_TEXT = """
     📊 N8N MONITORING TOOLS
     =======================
     
@@ -224,8 +321,9 @@ def get_help() -> str:
       - include_kpis: Calculate performance metrics
     
     ERROR DEBUGGING:
-    • get_error_executions(workflow_id)
+    • get_error_executions(workflow_id, summary_only=False)
       Retrieve detailed error information for a specific workflow
+      - summary_only: Keep the error summary, drop per-execution details
       - Returns last 5 errors with comprehensive debugging data
       - Shows error messages, failed nodes, trigger data
       - Identifies error patterns and problematic nodes
@@ -268,6 +366,12 @@ def get_help() -> str:
     5. Use workflow_id and execution_id for targeted fixes
     """
 
+
+@mcp.resource("n8n://help")
+def get_help() -> str:
+    """Get help documentation for the n8n monitoring tools"""
+    return _HELP_TEXT
+
 if __name__ == "__main__":
     logger.info("🚀 Starting n8n Monitor MCP Server")
     logger.info("Server ready for connections from Claude Desktop")
@@ -277,4 +381,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Shutting down server...")
     finally:
-        logger.info("Server stopped")
\ No newline at end of file
+        logger.info("Server stopped")
+        atexit.unregister(_stop_logging)
+        _stop_logging()
\ No newline at end of file
@@ -1,15 +1,23 @@
+import asyncio
+import functools
 import json
-from pathlib import Path
-from dotenv import load_dotenv
-from datetime import datetime
+import sys
 
 from utils.n8n_monitor_sync import N8nMonitor
 
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def _get_monitor():
+    """Single N8nMonitor shared by all tests"""
+    return N8nMonitor()
+
+def _print_lines(lines):
+    """Print lines with a single stdout write"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def test_error_executions(problematic):
     """Test the get_error_executions endpoint"""
-    monitor = N8nMonitor()
+    monitor = _get_monitor()
     
     print("=" * 60)
     print("Testing Error Executions Endpoint")
@@ -39,32 +47,37 @@ def test_error_executions(problematic):
         # Show error summary
         if "summary" in result and "error_patterns" in result["summary"]:
             print("\n📊 Error Patterns:")
-            for msg, info in result["summary"]["error_patterns"].items():
-                print(f"  • '{msg[:60]}...': {info['count']} occurrences")
+            _print_lines([f"  • '{msg[:60]}...': {info['count']} occurrences"
+                          for msg, info in result["summary"]["error_patterns"].items()])
         
         if "summary" in result and "failed_nodes" in result["summary"]:
             print("\n🔴 Failed Nodes:")
-            for node, count in result["summary"]["failed_nodes"].items():
-                print(f"  • {node}: {count} failures")
+            _print_lines([f"  • {node}: {count} failures"
+                          for node, count in result["summary"]["failed_nodes"].items()])
     
     # Save result for inspection
+    from pathlib import Path
     output_file = Path("error_executions_test.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    output_file.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
     print(f"\n💾 Results saved to: {output_file}")
     
     return True
 
-def test_executions():
-    monitor = N8nMonitor()
-    
+async def _fetch_executions_and_health(limit=50):
+    """Fetch the executions with KPIs and the health report concurrently"""
+    monitor = _get_monitor()
+    return await asyncio.gather(
+        asyncio.to_thread(monitor.get_workflow_executions, limit=limit, includes_kpis=True),
+        asyncio.to_thread(monitor.get_workflow_health_report, limit=limit)
+    )
+
+def test_executions(result, health_report):
     print("=" * 60)
     print("Testing Workflow Executions Endpoint")
     print("=" * 60)
     
-    # Test 1: Get executions for last 50 executions with KPIs
-    print("Test 1: Fetching last 50 executions with KPIs...")
-    result = monitor.get_workflow_executions(limit=50, includes_kpis=True)
+    # Test 1: Executions for last 50 executions with KPIs
+    print("Test 1: Checking last 50 executions with KPIs...")
     
     if "error" in result:
         print(f"❌ Error: {result['error']}")
@@ -89,8 +102,7 @@ def test_executions():
     if "executionModes" in result:
         modes = result["executionModes"]
         print("\n🔄 Execution Modes:")
-        for mode, count in modes.items():
-            print(f"  • {mode}: {count}")
+        _print_lines([f"  • {mode}: {count}" for mode, count in modes.items()])
     
     # Display timing metrics
     if "timing" in result:
@@ -109,20 +121,19 @@ def test_executions():
         problematic = alerts.get("workflowsNeedingAttention", [])
         if problematic:
             print("\n🔴 Workflows Needing Attention:")
-            for wf in problematic:
-                print(f"  • {wf['workflowId']}: {wf['failureRate']} failure rate ({wf['failedCount']} failed)")
+            _print_lines([f"  • {wf['workflowId']}: {wf['failureRate']} failure rate ({wf['failedCount']} failed)"
+                          for wf in problematic])
     
     # Report saved in the outputs
+    from pathlib import Path
     output_file = Path("execution_data.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    output_file.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding='utf-8')
     print(f"\n💾 Report saved to: {output_file}")
     
     # Test 2: Health report
     print("\nTest 2: Generating Health Report")
     
-    print("\n🏥 Generating health report for the last 50 executions")
-    health_report = monitor.get_workflow_health_report(limit=50)
+    print("\n🏥 Checking health report for the last 50 executions")
     
     if "error" in health_report:
         print(f"❌ Error: {health_report['error']}")
@@ -143,20 +154,31 @@ def test_executions():
             
             if prob_count > 0:
                 print("\n  Top Issues:")
-                for wf in health_report["problematic_workflows"][:3]:
-                    print(f"  • {wf['name']}: {wf['metrics']['failureRate']} failure rate")
+                _print_lines([f"  • {wf['name']}: {wf['metrics']['failureRate']} failure rate"
+                              for wf in health_report["problematic_workflows"][:3]])
         
         # Save health report
         report_file = Path("health_report.json")
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(health_report, f, indent=2, ensure_ascii=False)
+        report_file.write_text(json.dumps(health_report, indent=2, ensure_ascii=False), encoding='utf-8')
         print(f"\n💾 Health report saved to: {report_file}")
     
     print("✅ Executions function tested!")
     
     return problematic
 
-if __name__ == "__main__":
+async def _amain():
+    from datetime import datetime
     print(f"Starting test at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    problematic = test_executions()
-    test_error_executions(problematic)
\ No newline at end of file
+    
+    # Only the HTTP fan-out runs concurrently, the checks below print in order
+    print("Fetching last 50 executions and the health report...\n")
+    result, health_report = await _fetch_executions_and_health(limit=50)
+    
+    problematic = test_executions(result, health_report)
+    test_error_executions(problematic)
+
+if __name__ == "__main__":
+    # Load .env before the first N8nMonitor is built by _get_monitor()
+    from dotenv import load_dotenv
+    load_dotenv()
+    asyncio.run(_amain())
\ No newline at end of file
@@ -2,15 +2,61 @@
 N8n Monitor utility class - synchronous version for FastMCP
 """
 
+import functools
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import time
+from collections import Counter, defaultdict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Optional, Tuple
 import requests
-import traceback
+from requests.adapters import HTTPAdapter, Retry
+
+from utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Upper failure-rate bound (%) of each health status, anything above the last band is critical
+_HEALTH_BANDS = ((10.0, "🟢 Healthy"), (25.0, "🟡 Warning"))
+_CRITICAL_STATUS = "🔴 Critical"
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an n8n ISO-8601 timestamp, including the trailing 'Z' UTC designator"""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _parse_percent(value: str) -> float:
+    """Parse an n8n percentage such as '12.5%' (the '%' sign is optional)"""
+    return float(value[:-1]) if value.endswith("%") else float(value)
+
+
+# Per-error sections get_error_executions can extract and return
+ERROR_FIELDS = frozenset({"error", "trigger", "duration", "failed_node"})
+
+# Most monitor calls the MCP server runs at once; pools below are sized for it
+MAX_CONCURRENT_CALLS = 8
+
+
+def _ttl_cached(method):
+    """Cache successful results of a fetch method in the monitor's TTL cache"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        hit = self._cache.get(key)
+        if hit is not None:
+            return hit
+        
+        result = method(self, *args, **kwargs)
+        self._cache.put(key, result)
+        return result
+    return wrapper
+
 
 class N8nMonitor:
     """Handler for n8n monitoring operations - synchronous version"""
@@ -18,8 +64,46 @@ class N8nMonitor:
     def __init__(self):
         self.webhook_url = os.getenv("N8N_WEBHOOK_URL", "")
         self.timeout = 30
-        logger.info(f"n8n monitor initialized with webhook URL with a timeout of {self.timeout} seconds")
+        
+        # One pooled keep-alive session for all calls, so TCP/TLS handshakes are reused
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            # A health report can hold two connections at once
+            pool_maxsize=2 * MAX_CONCURRENT_CALLS,
+            # Every webhook action is a read-only query, so retrying the POST is safe.
+            # Read timeouts are re-raised as-is, so a hung webhook fails after one timeout,
+            # and the last 5xx response still goes through raise_for_status().
+            max_retries=Retry(
+                total=2,
+                read=False,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Short-lived cache of parsed webhook responses (and the workflow-name map), shared by all threads
+        self._cache = TTLCache(ttl=5.0, maxsize=128)
+        
+        # Health reports fetch the workflow names on this pool while the caller fetches executions,
+        # so concurrent reports never queue behind each other
+        self._pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS, thread_name_prefix="n8n-monitor")
+        
+        # Report timestamp, formatted at most once per second
+        self._iso_sec = None
+        self._iso_cached = ""
+        logger.info("n8n monitor initialized with webhook URL with a timeout of %s seconds", self.timeout)
+    
+    def close(self):
+        """Close the pooled HTTP connections and the worker threads"""
+        self._pool.shutdown(wait=False)
+        self._session.close()
     
+    @_ttl_cached
     def get_active_workflows(self) -> Dict[str, Any]:
         """Fetch all active workflows from n8n"""
         if not self.webhook_url:
@@ -28,7 +112,7 @@ class N8nMonitor:
         
         try:
             logger.info("Fetching active workflows from n8n")
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
                 json={"action": "get_active_workflows"},
                 timeout=self.timeout
@@ -37,52 +121,58 @@ class N8nMonitor:
             
             data = response.json()
             
-            logger.debug(f"Response type: {type(data)}")
+            logger.debug("Response type: %s", type(data))
             
             # List of all workflows conteined 
             workflows = []
             if isinstance(data, list):
                 workflows = [item for item in data if isinstance(item, dict)]
                 if not workflows and data:
-                    logger.error(f"Expected list of dictionaries, got list of {type(data[0]).__name__}")
+                    logger.error("Expected list of dictionaries, got list of %s", type(data[0]).__name__)
                     return {"error": "Webhook returned invalid data format"}
             elif isinstance(data, dict):
                 if "data" in data:
                     workflows = data["data"]
                 else:
-                    logger.error(f"Unexpected dict response with keys: {list(data.keys())} \n {traceback.format_exc()}")
+                    logger.error("Unexpected dict response with keys: %s", list(data.keys()))
                     return {"error": "Unexpected response format"}
             else:
-                logger.error(f"Unexpected response type: {type(data)} \n {traceback.format_exc()}")
+                logger.error("Unexpected response type: %s", type(data))
                 return {"error": f"Unexpected response type: {type(data).__name__}"}
             
-            logger.info(f"Successfully fetched {len(workflows)} active workflows")
+            logger.info("Successfully fetched %s active workflows", len(workflows))
+            
+            # Build the detailed list and the names summary in a single pass
+            result, names = [], []
+            for wf in workflows:
+                get = wf.get
+                name = get("name", "Unnamed")
+                result.append({
+                    "id": get("id", "unknown"),
+                    "name": name,
+                    "created": get("createdAt", ""),
+                    "updated": get("updatedAt", ""),
+                    "archived": get("isArchived", "false") == "true"
+                })
+                names.append(name)
             
             return {
                 "total_active": len(workflows),
-                "workflows": [
-                    {
-                        "id": wf.get("id", "unknown"),
-                        "name": wf.get("name", "Unnamed"),
-                        "created": wf.get("createdAt", ""),
-                        "updated": wf.get("updatedAt", ""),
-                        "archived": wf.get("isArchived", "false") == "true"
-                    }
-                    for wf in workflows
-                ],
+                "workflows": result,
                 "summary": {
                     "total": len(workflows),
-                    "names": [wf.get("name", "Unnamed") for wf in workflows]
+                    "names": names
                 }
             }
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching workflows: {e} \n {traceback.format_exc()}")
-            return {"error": f"Failed to fetch workflows: {str(e)} \n {traceback.format_exc()}"}
+            logger.exception("Error fetching workflows: %s", e)
+            return {"error": f"Failed to fetch workflows: {str(e)}"}
         except Exception as e:
-            logger.error(f"Unexpected error fetching workflows: {e} \n {traceback.format_exc()}")
-            return {"error": f"Unexpected error: {str(e)} \n {traceback.format_exc()}"}
+            logger.exception("Unexpected error fetching workflows: %s", e)
+            return {"error": f"Unexpected error: {str(e)}"}
     
+    @_ttl_cached
     def get_workflow_executions(
         self, 
         limit: int = 50,
@@ -94,14 +184,14 @@ class N8nMonitor:
             return {"error": "N8N_WEBHOOK_URL environment variable not set"}
         
         try:
-            logger.info(f"Fetching the last {limit} executions")
+            logger.info("Fetching the last %s executions", limit)
             
             payload = {
                 "action": "get_workflow_executions",
                 "limit": limit
             }
             
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=self.timeout
@@ -120,49 +210,72 @@ class N8nMonitor:
 
                 if "summary" in data:
                     summary = data["summary"]
-                    failure_rate = float(summary.get("failureRate", "0").rstrip("%"))
+                    failure_rate = _parse_percent(summary.get("failureRate", "0"))
                     data["insights"] = {
-                        "health_status": "🟢 Healthy" if failure_rate < 10 else 
-                                    "🟡 Warning" if failure_rate < 25 else 
-                                    "🔴 Critical",
+                        "health_status": next(
+                            (status for bound, status in _HEALTH_BANDS if failure_rate < bound),
+                            _CRITICAL_STATUS
+                        ),
                         "message": f"{summary.get('totalExecutions', 0)} executions with {summary.get('failureRate', '0%')} failure rate"
                     }
             
             return data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP error fetching executions: {e} \n {traceback.format_exc()}")
+            logger.exception("HTTP error fetching executions: %s", e)
             return {"error": f"Failed to fetch executions: {str(e)}"}
         except Exception as e:
-            logger.error(f"Unexpected error fetching executions: {e} \n {traceback.format_exc()}")
+            logger.exception("Unexpected error fetching executions: %s", e)
             return {"error": f"Unexpected error: {str(e)}"}
     
+    def _now_iso(self) -> str:
+        """Current UTC time as an ISO-8601 string, at one-second resolution"""
+        sec = time.time_ns() // 1_000_000_000
+        if sec != self._iso_sec:
+            self._iso_cached = datetime.fromtimestamp(sec, tz=timezone.utc).isoformat()
+            self._iso_sec = sec
+        return self._iso_cached
+    
+    def _get_workflow_names_cached(
+        self,
+        max_age: float = 60.0
+    ) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+        """Return the active workflows' id -> name map, refetched at most every max_age seconds, and the fetch error if any"""
+        # Workflow names change rarely, so health reports reuse the map for a while
+        hit = self._cache.get(("workflow_names",))
+        if hit is not None:
+            return hit["names"], None
+        
+        workflows_data = self.get_active_workflows()
+        if "error" in workflows_data:
+            return {}, workflows_data
+        
+        workflow_names = {
+            wf["id"]: wf["name"] 
+            for wf in workflows_data.get("workflows", [])
+        }
+        # Wrapped so that a workflow whose id is "error" cannot look like a failure to the cache
+        self._cache.put(("workflow_names",), {"names": workflow_names}, ttl=max_age)
+        return workflow_names, None
+    
     def get_workflow_health_report(self, limit: int = 50) -> Dict[str, Any]:
         """Generate a comprehensive health report for all workflows"""
         try:
-            logger.info(f"Generating health report for last {limit} executions")
+            logger.info("Generating health report for last %s executions", limit)
 
-            # Get executions with KPIs
+            # Get active workflows (for names) in the background while fetching executions with KPIs here
+            names_future = self._pool.submit(self._get_workflow_names_cached)
             exec_data = self.get_workflow_executions(limit=limit, includes_kpis=True)
+            workflow_names, names_error = names_future.result()
 
-            if "error" in exec_data:
-                return exec_data
-            
-            # Get active workflows for names
-            workflows_data = self.get_active_workflows()
-            
-            if "error" in workflows_data:
-                return workflows_data
-            
-            # Create workflow name mapping
-            workflow_names = {
-                wf["id"]: wf["name"] 
-                for wf in workflows_data.get("workflows", [])
-            }
+            # Report both failures when both fetches went wrong (once if they are identical)
+            errors = dict.fromkeys(d["error"] for d in (exec_data, names_error or {}) if "error" in d)
+            if errors:
+                return {"error": "; ".join(errors)}
             
             # Build comprehensive report
             report = {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": self._now_iso(),
                 "overall_health": exec_data.get("insights", {}),
                 "summary": exec_data.get("summary", {}),
                 "execution_modes": exec_data.get("executionModes", {}),
@@ -172,10 +285,11 @@ class N8nMonitor:
                 "alerts": exec_data.get("alerts", {})
             }
             
-            # Categorize workflows by health
+            # Categorize workflows by health, keeping the parsed failure rate for sorting
+            problematic = []
             if "workflowPerformance" in exec_data and "allWorkflowMetrics" in exec_data["workflowPerformance"]:
                 for wf_id, metrics in exec_data["workflowPerformance"]["allWorkflowMetrics"].items():
-                    failure_rate = float(metrics.get("failureRate", "0%").rstrip("%"))
+                    failure_rate = _parse_percent(metrics.get("failureRate", "0%"))
                     wf_info = {
                         "id": wf_id,
                         "name": workflow_names.get(wf_id, f"Unknown ({wf_id})"),
@@ -183,26 +297,25 @@ class N8nMonitor:
                     }
                     
                     if failure_rate > 10:
-                        report["problematic_workflows"].append(wf_info)
+                        problematic.append((failure_rate, wf_info))
                     else:
                         report["healthy_workflows"].append(wf_info)
             
             # Sort problematic workflows by failure rate
-            report["problematic_workflows"].sort(
-                key=lambda x: float(x["metrics"].get("failureRate", "0%").rstrip("%")), 
-                reverse=True
-            )
+            problematic.sort(key=itemgetter(0), reverse=True)
+            report["problematic_workflows"] = [wf_info for _, wf_info in problematic]
             
             logger.info("Health report generated successfully")
             return report
             
         except Exception as e:
-            logger.error(f"Error generating health report: {e}")
+            logger.error("Error generating health report: %s", e)
             return {"error": f"Failed to generate health report: {str(e)}"}
         
     def get_error_executions(self, 
                              workflow_id: str,
-                             limit: int = 5
+                             limit: int = 5,
+                             fields: Iterable[str] = ERROR_FIELDS
                              ) -> Dict[str, Any]:
             """
             Fetch recent error executions for a specific workflow with detailed debugging info.
@@ -210,155 +323,171 @@ class N8nMonitor:
             Args:
                 workflow_id: The ID of the workflow to check for errors
                 limit: The maximum number of error executions to retrieve
+                fields: Sections to include in each error ("error", "trigger", "duration", "failed_node");
+                        trigger and duration are not computed when left out, the summary is always built
             Returns:
                 Dictionary with detailed error executions
             """
             if not workflow_id:
                 return {"error": "workflow_id parameter is required"}
             
+            # Normalise before the cache key is built, so any iterable of names works
+            if isinstance(fields, str):
+                fields = (fields,)
             try:
-                logger.info(f"Fetching error executions for workflow {workflow_id}")
-                
-                response = requests.post(
-                    self.webhook_url,
-                    json={
-                        "action": "get_execution_details",
-                        "limit": limit,
-                        "workflow_id": workflow_id
-                    },
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                data = response.json()
+                fields = frozenset(fields)
+            except TypeError:
+                return {"error": f"fields must be an iterable of names from: {', '.join(sorted(ERROR_FIELDS))}"}
+            
+            unknown = fields - ERROR_FIELDS
+            if unknown:
+                return {"error": f"Unknown fields: {', '.join(sorted(map(str, unknown)))}"}
+            
+            return self._get_error_executions(workflow_id, limit, fields)
+    
+    @_ttl_cached
+    def _get_error_executions(self, workflow_id: str, limit: int, fields: frozenset) -> Dict[str, Any]:
+        """Fetch and shape error executions; fields is an already validated frozenset"""
+        try:
+            logger.info("Fetching error executions for workflow %s", workflow_id)
+            
+            response = self._session.post(
+                self.webhook_url,
+                json={
+                    "action": "get_execution_details",
+                    "limit": limit,
+                    "workflow_id": workflow_id
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            # Extract executions array
+            if isinstance(data, list):
+                executions = data
+            elif isinstance(data, dict) and "data" in data:
+                executions = data["data"]
+            else:
+                return {"error": "Unexpected response format"}
+            
+            # Drop malformed entries once so the loop below can assume dicts
+            executions = [e for e in executions if isinstance(e, dict)]
+            
+            # Process executions with enhanced details and aggregate the summary on the way
+            error_details = []
+            error_patterns = defaultdict(lambda: {"count": 0, "executions": []})
+            node_failures = Counter()
+            
+            for exec in executions:
+                # Extract comprehensive error information
+                error_info = {}
+                failed_node_details = {}
+                last_node = "Unknown"
+                trigger_info = {}
                 
-                # Extract executions array
-                if isinstance(data, list):
-                    executions = data
-                elif isinstance(data, dict) and "data" in data:
-                    executions = data["data"]
-                else:
-                    return {"error": "Unexpected response format"}
+                exec_data = exec.get("data")
+                result_data = exec_data.get("resultData", {}) if isinstance(exec_data, dict) else None
                 
-                # Process executions with enhanced details
-                error_details = []
-                for exec in executions:
-                    if not isinstance(exec, dict):
-                        continue
-                    
-                    # Extract comprehensive error information
-                    error_info = {}
-                    failed_node_details = {}
-                    
-                    if isinstance(exec.get("data"), dict):
-                        result_data = exec["data"].get("resultData", {})
+                if isinstance(result_data, dict):
+                    # Get error details
+                    err = result_data.get("error")
+                    if isinstance(err, dict):
+                        error_info = {
+                            "message": err.get("message", "Unknown error"),
+                            "description": err.get("description"),
+                            "http_code": err.get("httpCode"),
+                            "level": err.get("level", "error"),  # warning, error, critical
+                            "timestamp": err.get("timestamp")
+                        }
                         
-                        # Get error details
-                        if isinstance(result_data, dict) and "error" in result_data:
-                            err = result_data["error"]
-                            error_info = {
-                                "message": err.get("message", "Unknown error"),
-                                "description": err.get("description"),
-                                "http_code": err.get("httpCode"),
-                                "level": err.get("level", "error"),  # warning, error, critical
-                                "timestamp": err.get("timestamp")
+                        # Get failed node details
+                        node = err.get("node")
+                        if isinstance(node, dict):
+                            failed_node_details = {
+                                "name": node.get("name"),
+                                "type": node.get("type"),
+                                "id": node.get("id"),
+                                "position": node.get("position")
                             }
-                            
-                            # Get failed node details
-                            if isinstance(err.get("node"), dict):
-                                node = err["node"]
-                                failed_node_details = {
-                                    "name": node.get("name"),
-                                    "type": node.get("type"),
-                                    "id": node.get("id"),
-                                    "position": node.get("position")
-                                }
-                        
-                        # Get last executed node if different
-                        last_node = result_data.get("lastNodeExecuted")
-                    
-                    # Extract trigger information (what caused this execution)
-                    trigger_info = {}
-                    if isinstance(exec.get("data"), dict):
-                        run_data = exec["data"].get("resultData", {}).get("runData", {})
-                        if isinstance(run_data, dict) and "Webhook" in run_data:
-                            webhook_data = run_data["Webhook"]
-                            if isinstance(webhook_data, list) and len(webhook_data) > 0:
-                                first_webhook = webhook_data[0]
-                                if isinstance(first_webhook.get("data"), dict):
-                                    main_data = first_webhook["data"].get("main", [[]])[0]
-                                    if main_data and len(main_data) > 0:
-                                        trigger_json = main_data[0].get("json", {})
-                                        trigger_info = {
-                                            "action": trigger_json.get("body", {}).get("action") if isinstance(trigger_json.get("body"), dict) else None,
-                                            "parameters": trigger_json.get("body"),
-                                            "execution_mode": trigger_json.get("executionMode", "production")
-                                        }
-                    
-                    # Calculate duration
-                    duration = None
-                    if exec.get("startedAt") and exec.get("stoppedAt"):
-                        try:
-                            start = datetime.fromisoformat(exec["startedAt"].replace("Z", "+00:00"))
-                            stop = datetime.fromisoformat(exec["stoppedAt"].replace("Z", "+00:00"))
-                            duration = (stop - start).total_seconds()
-                        except:
-                            pass
                     
-                    # Get workflow name
-                    workflow_name = None
-                    if isinstance(exec.get("workflowData"), dict):
-                        workflow_name = exec["workflowData"].get("name")
+                    # Get last executed node if different
+                    last_node = result_data.get("lastNodeExecuted")
                     
-                    error_details.append({
-                        "id": exec.get("id"),
-                        "workflow_name": workflow_name,
-                        "status": exec.get("status", "error"),
-                        "mode": exec.get("mode"),
-                        "started_at": exec.get("startedAt"),
-                        "stopped_at": exec.get("stoppedAt"),
-                        "duration_seconds": duration,
-                        "finished": exec.get("finished", False),
-                        "retry_of": exec.get("retryOf"),
-                        "retry_success_id": exec.get("retrySuccessId"),
-                        "error": error_info or {"message": "Error details not available"},
-                        "failed_node": failed_node_details or {"name": last_node if 'last_node' in locals() else "Unknown"},
-                        "trigger": trigger_info
-                    })
+                    # Extract trigger information (what caused this execution), any missing level means no trigger
+                    if "trigger" in fields:
+                        with suppress(KeyError, IndexError, TypeError, AttributeError):
+                            trigger_json = result_data["runData"]["Webhook"][0]["data"]["main"][0][0].get("json", {})
+                            body = trigger_json.get("body")
+                            trigger_info = {
+                                "action": body.get("action") if isinstance(body, dict) else None,
+                                "parameters": body,
+                                "execution_mode": trigger_json.get("executionMode", "production")
+                            }
                 
-                # Create summary with patterns
-                error_patterns = {}
-                node_failures = {}
+                # Calculate duration
+                duration = None
+                if "duration" in fields and exec.get("startedAt") and exec.get("stoppedAt"):
+                    try:
+                        duration = (_parse_timestamp(exec["stoppedAt"]) - _parse_timestamp(exec["startedAt"])).total_seconds()
+                    except (TypeError, ValueError, AttributeError):
+                        pass
                 
-                for detail in error_details:
-                    # Group by error message
-                    msg = detail["error"].get("message", "Unknown")
-                    if msg not in error_patterns:
-                        error_patterns[msg] = {"count": 0, "executions": []}
-                    error_patterns[msg]["count"] += 1
-                    error_patterns[msg]["executions"].append(detail["id"])
-                    
-                    # Count node failures
-                    node_name = detail["failed_node"].get("name", "Unknown")
-                    if node_name:
-                        node_failures[node_name] = node_failures.get(node_name, 0) + 1
+                # Get workflow name
+                workflow_data = exec.get("workflowData")
+                workflow_name = workflow_data.get("name") if isinstance(workflow_data, dict) else None
                 
-                return {
-                    "workflow_id": workflow_id,
-                    "workflow_name": error_details[0]["workflow_name"] if error_details else "Unknown",
-                    "error_count": len(error_details),
-                    "errors": error_details,
-                    "summary": {
-                        "total_errors": len(error_details),
-                        "error_patterns": error_patterns,
-                        "failed_nodes": node_failures,
-                        "time_range": {
-                            "oldest": error_details[-1]["started_at"] if error_details else None,
-                            "newest": error_details[0]["started_at"] if error_details else None
-                        }
-                    }
+                error = error_info or {"message": "Error details not available"}
+                failed_node = failed_node_details or {"name": last_node}
+                
+                detail = {
+                    "id": exec.get("id"),
+                    "workflow_name": workflow_name,
+                    "status": exec.get("status", "error"),
+                    "mode": exec.get("mode"),
+                    "started_at": exec.get("startedAt"),
+                    "stopped_at": exec.get("stoppedAt")
                 }
+                if "duration" in fields:
+                    detail["duration_seconds"] = duration
+                detail["finished"] = exec.get("finished", False)
+                detail["retry_of"] = exec.get("retryOf")
+                detail["retry_success_id"] = exec.get("retrySuccessId")
+                if "error" in fields:
+                    detail["error"] = error
+                if "failed_node" in fields:
+                    detail["failed_node"] = failed_node
+                if "trigger" in fields:
+                    detail["trigger"] = trigger_info
+                error_details.append(detail)
+                
+                # Group by error message
+                pattern = error_patterns[error.get("message", "Unknown")]
+                pattern["count"] += 1
+                pattern["executions"].append(detail["id"])
                 
-            except Exception as e:
-                logger.error(f"Error fetching executions: {e}")
-                return {"error": str(e)}
\ No newline at end of file
+                # Count node failures
+                node_name = failed_node.get("name", "Unknown")
+                if node_name:
+                    node_failures[node_name] += 1
+            
+            return {
+                "workflow_id": workflow_id,
+                "workflow_name": error_details[0]["workflow_name"] if error_details else "Unknown",
+                "error_count": len(error_details),
+                "errors": error_details,
+                "summary": {
+                    "total_errors": len(error_details),
+                    "error_patterns": dict(error_patterns),
+                    "failed_nodes": dict(node_failures),
+                    "time_range": {
+                        "oldest": error_details[-1]["started_at"] if error_details else None,
+                        "newest": error_details[0]["started_at"] if error_details else None
+                    }
+                }
+            }
+            
+        except Exception as e:
+            logger.error("Error fetching executions: %s", e)
+            return {"error": str(e)}
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Small TTL cache for successful n8n results, shared by the MCP server and N8nMonitor
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after a TTL; error results are never stored"""
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        with self._lock:
+            hit = self._entries.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        return None
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a successful result under key for ttl seconds (default: the cache TTL)"""
+        # Never pin failures in the cache
+        if not isinstance(value, dict) or "error" in value:
+            return
+
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                # Dicts keep insertion order, so the first entry is the oldest
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (expires, value)